@@ -9,20 +9,46 @@ import sys
 import json
 import re
 import logging
-import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import subprocess
-from dataclasses import dataclass, asdict
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from typing import Dict, Iterator, List, Optional, Any
+from dataclasses import dataclass
+
+try:
+    import orjson  # Optional: faster JSON output (see requirements.txt)
+except ImportError:
+    orjson = None
+
+# Logging is configured by main(); library users keep their own setup
 logger = logging.getLogger('FilmCrewAI')
 
+# Screenplay patterns, compiled once for every ScriptParser and only ever
+# matched against a single line
+_SCENE_RE = re.compile(r'^(INT\.|EXT\.|INT/EXT\.)\s+(.+?)\s*[-–]\s*(.+)$')
+_SCENE_PREFIXES = ('INT', 'EXT')
+# A stripped script line is a character cue or a parenthetical, never both
+_LINE_RE = re.compile(r'(?P<character>[A-Z][A-Z\s]+(?:\([^)]+\))?)$|(?P<parenthetical>\([^)]+\))$')
+
+
+def _scan_files(directory: Path, suffix: str) -> List[Path]:
+    """List regular files in directory whose names end with suffix"""
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.endswith(suffix) and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+class ShotType:
+    """Shot types generated by ScriptParser (Shot.shot_type may hold any string)"""
+    WIDE_ESTABLISHING = "WIDE ESTABLISHING"
+    MEDIUM = "MEDIUM"
+    CLOSE_UP = "CLOSE-UP"
+
 
 @dataclass
 class Shot:
@@ -33,11 +59,20 @@ class Shot:
     scene_heading: str
     action: str
     dialogue: List[str]
-    shot_type: str = "MEDIUM"
+    shot_type: str = ShotType.MEDIUM
     duration: str = "3-5 seconds"
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'shot_id': self.shot_id,
+            'scene_number': self.scene_number,
+            'shot_number': self.shot_number,
+            'scene_heading': self.scene_heading,
+            'action': self.action,
+            'dialogue': list(self.dialogue),
+            'shot_type': self.shot_type,
+            'duration': self.duration
+        }
 
 
 @dataclass
@@ -64,43 +99,44 @@ class Scene:
 class ScriptParser:
     """Parses screenplay format into structured data"""
     
-    def __init__(self):
-        self.scene_pattern = re.compile(r'^(INT\.|EXT\.|INT/EXT\.)\s+(.+?)\s*[-–]\s*(.+)$', re.MULTILINE)
-        self.character_pattern = re.compile(r'^[A-Z][A-Z\s]+(\([^)]+\))?$')
-        self.parenthetical_pattern = re.compile(r'^\([^)]+\)$')
-        
     def parse(self, script_path: Path) -> List[Scene]:
         """Parse script file into scenes"""
-        logger.info(f"Parsing script: {script_path}")
-        
-        with open(script_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return list(self.parse_iter(script_path))
+    
+    def parse_iter(self, script_path: Path) -> Iterator[Scene]:
+        """Parse script file into scenes, yielding each scene as soon as it is read
         
-        scenes = []
-        scene_matches = list(self.scene_pattern.finditer(content))
+        Only the current scene's lines are kept in memory, unless the script has
+        no scene headings at all and the whole file becomes a single scene.
+        """
+        logger.info(f"Parsing script: {script_path}")
         
-        if not scene_matches:
+        scene_number = 0
+        scene_lines = []
+        
+        with open(script_path, 'r', encoding='utf-8', buffering=1 << 16) as f:
+            for line in f:
+                if line.startswith(_SCENE_PREFIXES) and _SCENE_RE.match(line):
+                    if scene_number:
+                        yield self._parse_scene(scene_number, ''.join(scene_lines))
+                    # Text before the first heading is dropped once a heading is found
+                    scene_number += 1
+                    scene_lines = []
+                scene_lines.append(line)
+        
+        if scene_number:
+            yield self._parse_scene(scene_number, ''.join(scene_lines))
+        else:
             # If no scene headings found, treat entire script as one scene
             logger.warning("No scene headings found, treating as single scene")
-            scene = self._create_default_scene(content)
-            scenes.append(scene)
-        else:
-            for i, match in enumerate(scene_matches):
-                scene_start = match.start()
-                scene_end = scene_matches[i + 1].start() if i + 1 < len(scene_matches) else len(content)
-                scene_text = content[scene_start:scene_end]
-                
-                scene = self._parse_scene(i + 1, scene_text)
-                scenes.append(scene)
-        
-        return scenes
+            yield self._create_default_scene(''.join(scene_lines))
     
     def _parse_scene(self, scene_number: int, scene_text: str) -> Scene:
         """Parse individual scene"""
         lines = scene_text.strip().split('\n')
         
         # Parse scene heading
-        heading_match = self.scene_pattern.match(lines[0])
+        heading_match = _SCENE_RE.match(lines[0])
         if heading_match:
             int_ext = heading_match.group(1)
             location = heading_match.group(2)
@@ -116,21 +152,27 @@ class ScriptParser:
         action_blocks = []
         dialogue_blocks = []
         current_block = []
+        dialogue_lines = None  # 'lines' of the dialogue block being read
         
-        for line in lines[1:]:
+        for line in islice(lines, 1, None):
             line = line.strip()
             if not line:
                 if current_block:
                     action_blocks.append(' '.join(current_block))
                     current_block = []
-            elif self.character_pattern.match(line):
+                continue
+            
+            line_match = _LINE_RE.match(line)
+            line_kind = line_match.lastgroup if line_match else None
+            if line_kind == 'character':
                 # Start of dialogue
                 if current_block:
                     action_blocks.append(' '.join(current_block))
                     current_block = []
-                dialogue_blocks.append({'character': line, 'lines': []})
-            elif dialogue_blocks and not self.parenthetical_pattern.match(line):
-                dialogue_blocks[-1]['lines'].append(line)
+                dialogue_lines = []
+                dialogue_blocks.append({'character': line, 'lines': dialogue_lines})
+            elif dialogue_lines is not None and line_kind != 'parenthetical':
+                dialogue_lines.append(line)
             else:
                 current_block.append(line)
         
@@ -187,9 +229,9 @@ class ScriptParser:
             scene_number=scene_number,
             shot_number=1,
             scene_heading=heading,
-            action=' '.join(action_blocks[:1]) if action_blocks else "",
+            action=action_blocks[0] if action_blocks else "",
             dialogue=[],
-            shot_type="WIDE ESTABLISHING",
+            shot_type=ShotType.WIDE_ESTABLISHING,
             duration="5-8 seconds"
         ))
         
@@ -200,9 +242,9 @@ class ScriptParser:
                 scene_number=scene_number,
                 shot_number=2,
                 scene_heading=heading,
-                action=' '.join(action_blocks[1:2]) if len(action_blocks) > 1 else "",
+                action=action_blocks[1] if len(action_blocks) > 1 else "",
                 dialogue=[d['character'] for d in dialogue_blocks[:2]],
-                shot_type="MEDIUM",
+                shot_type=ShotType.MEDIUM,
                 duration="3-5 seconds"
             ))
         
@@ -215,35 +257,258 @@ class ScriptParser:
                 scene_heading=heading,
                 action="",
                 dialogue=[d['character'] for d in dialogue_blocks[2:]],
-                shot_type="CLOSE-UP",
+                shot_type=ShotType.CLOSE_UP,
                 duration="2-4 seconds"
             ))
         
         return shots
 
 
+# Builders for agent output pieces that depend only on the shot type or the
+# scene setting. They return new dicts on every call and are deliberately not
+# memoized: cached dicts were shared between shots, so changing one shot's
+# output changed the others.
+def _camera_setup(shot_type: str) -> Dict:
+    """Camera settings for a shot type"""
+    establishing = "ESTABLISHING" in shot_type
+    return {
+        "shot_size": shot_type,
+        "angle": "Eye level" if establishing else "Slight low angle",
+        "movement": "Slow push in" if establishing else "Static or subtle drift",
+        "lens": "24mm" if "WIDE" in shot_type else "50mm"
+    }
+
+
+def _environment_design(location: str, time_of_day: str) -> Dict:
+    """Environment description for a scene setting"""
+    return {
+        "location": location,
+        "atmosphere": "Lived-in, authentic",
+        "time_markers": time_of_day,
+        "weather": "Clear" if time_of_day == "DAY" else "Overcast"
+    }
+
+
+def _technical_summary(shot_type: str) -> Dict:
+    """Prompt-combiner technical summary for a shot type"""
+    return {
+        "camera": shot_type,
+        "lighting": "Natural/motivated",
+        "audio": "Diegetic focus"
+    }
+
+
+_CAMERA_DESC_BY_SHOT = {
+    ShotType.WIDE_ESTABLISHING: "Wide establishing shot, slow push-in, subtle handheld movement for organic feel",
+    ShotType.MEDIUM: "Medium shot, minimal movement, slight drift for life",
+    ShotType.CLOSE_UP: "Close-up, locked off or minimal float, intimate framing"
+}
+
+# Veo3 prompt sections, each closed with "..."; music and sound are fixed
+_VEO3_TEMPLATE = (
+    "[CAMERA] {camera}... "
+    "[SUBJECT] {subject}... "
+    "[ENVIRONMENT] {location}, {time_of_day} lighting, lived-in details, atmospheric depth... "
+    "[LIGHTING] {lighting}, motivated sources, cinematic contrast... "
+    "[MUSIC] No score, environmental sound only... "
+    "[SOUND] Layered ambience, specific spot effects, off-screen world..."
+)
+
+
+def _extract_characters(shot: Shot) -> List[str]:
+    """Extract character names from shot"""
+    # Dict keys dedupe in O(1) while keeping first-seen order
+    characters = {}
+    for dialogue in shot.dialogue:
+        # Extract character name (remove parentheticals)
+        char_name = dialogue.partition('(')[0].strip()
+        if char_name:
+            characters[char_name] = None
+    return list(characters) if characters else ["SUBJECT"]
+
+
+def _generate_veo3_prompt(scene: Scene, shot: Shot) -> str:
+    """Generate comprehensive Veo3 prompt"""
+    # Camera
+    camera = _CAMERA_DESC_BY_SHOT.get(shot.shot_type, "Medium shot with motivated movement")
+    
+    # Subject
+    if shot.dialogue:
+        subject = f"Characters: {', '.join(shot.dialogue[:2])}, in conversation"
+    elif shot.action:
+        subject = shot.action[:100]
+    else:
+        subject = "Environmental shot"
+    
+    # Lighting
+    lighting = "Natural daylight" if "DAY" in scene.time_of_day else "Practical sources, moody"
+    
+    return _VEO3_TEMPLATE.format(
+        camera=camera,
+        subject=subject,
+        location=scene.location,
+        time_of_day=scene.time_of_day,
+        lighting=lighting
+    )
+
+
+# Rule-based agent outputs, one function per agent. In production these
+# would call actual AI. Each call builds new dicts and lists, since callers
+# may modify the output of one shot.
+def _script_breakdown_output(scene: Scene, shot: Shot) -> Dict:
+    """Script-breakdown agent output for a shot"""
+    return {
+        "analysis": {
+            "genre": "Drama",
+            "tone": "Intimate",
+            "pacing": "Measured",
+            "emotional_arc": "Discovery to tension"
+        },
+        "shot_breakdown": {
+            "shot_id": shot.shot_id,
+            "necessity": "essential",
+            "dramatic_purpose": "Establish character state and environment"
+        }
+    }
+
+
+def _camera_director_output(scene: Scene, shot: Shot) -> Dict:
+    """Camera-director agent output for a shot"""
+    return {
+        "shot_id": shot.shot_id,
+        "camera": _camera_setup(shot.shot_type),
+        "visual_purpose": {
+            "literal": "Show character and environment",
+            "poetic": "Isolation within crowd",
+            "emotional": "Anticipation and searching"
+        }
+    }
+
+
+def _lighting_designer_output(scene: Scene, shot: Shot) -> Dict:
+    """Lighting-designer agent output for a shot"""
+    return {
+        "shot_id": shot.shot_id,
+        "lighting_design": {
+            "emotional_goal": "Natural realism with subtle mood",
+            "key_light": "Window light - soft, directional",
+            "fill_ratio": "2:1 for gentle contrast",
+            "practicals": ["Overhead fixtures", "Window light"],
+            "color": "5600K daylight mixed with 3200K practicals"
+        }
+    }
+
+
+def _sound_designer_output(scene: Scene, shot: Shot) -> Dict:
+    """Sound-designer agent output for a shot"""
+    return {
+        "shot_id": shot.shot_id,
+        "soundscape": {
+            "on_screen": ["Footsteps", "Breathing", "Clothing rustle"],
+            "off_screen": ["Traffic", "Distant conversations"],
+            "ambience": ["Room tone", "HVAC hum"],
+            "spot_effects": ["Door close", "Chair scrape"]
+        },
+        "perspective": "Objective transitioning to subjective"
+    }
+
+
+def _music_director_output(scene: Scene, shot: Shot) -> Dict:
+    """Music-director agent output for a shot"""
+    return {
+        "shot_id": shot.shot_id,
+        "music_decision": {
+            "presence": "silence",
+            "reasoning": "Let environment and tension speak"
+        },
+        "if_silence": {
+            "type": "complete",
+            "duration": "entire shot",
+            "break": "none"
+        }
+    }
+
+
+def _character_analysis_output(scene: Scene, shot: Shot) -> Dict:
+    """Character-analysis agent output for a shot"""
+    return {
+        "shot_id": shot.shot_id,
+        "characters": _extract_characters(shot),
+        "emotional_state": "Searching, tired, anticipatory",
+        "physical_markers": "Shoulders tense, scanning motion"
+    }
+
+
+def _background_designer_output(scene: Scene, shot: Shot) -> Dict:
+    """Background-designer agent output for a shot"""
+    return {
+        "shot_id": shot.shot_id,
+        "environment": _environment_design(scene.location, scene.time_of_day),
+        "design_layers": {
+            "foreground": ["Tables", "Characters"],
+            "midground": ["Other patrons", "Counter"],
+            "background": ["Windows", "Street view"],
+            "movement": ["Steam", "People passing"]
+        }
+    }
+
+
+def _prompt_combiner_output(scene: Scene, shot: Shot) -> Dict:
+    """Prompt-combiner agent output for a shot"""
+    return {
+        "shot_id": shot.shot_id,
+        "veo3_prompt": _generate_veo3_prompt(scene, shot),
+        "necessity_verdict": "essential",
+        "technical_summary": _technical_summary(shot.shot_type)
+    }
+
+
+_AGENT_DISPATCH = {
+    "script-breakdown": _script_breakdown_output,
+    "camera-director": _camera_director_output,
+    "lighting-designer": _lighting_designer_output,
+    "sound-designer": _sound_designer_output,
+    "music-director": _music_director_output,
+    "character-analysis": _character_analysis_output,
+    "background-designer": _background_designer_output,
+    "prompt-combiner": _prompt_combiner_output
+}
+
+
 class AgentOrchestrator:
     """Orchestrates AI agent processing"""
     
     def __init__(self, agents_dir: Path):
         self.agents_dir = agents_dir
         self.agents = self._load_agents()
+        self._content_cache: Dict[str, tuple] = {}  # agent name -> (mtime_ns, content)
         
     def _load_agents(self) -> Dict[str, Dict]:
-        """Load agent configurations"""
+        """Register agent configurations; their prompts are read on demand"""
         agents = {}
-        for agent_file in self.agents_dir.glob("*.md"):
+        for agent_file in _scan_files(self.agents_dir, ".md"):
             agent_name = agent_file.stem
-            with open(agent_file, 'r', encoding='utf-8') as f:
-                content = f.read()
             agents[agent_name] = {
                 'name': agent_name,
-                'content': content,
                 'file': str(agent_file)
             }
         logger.info(f"Loaded {len(agents)} agents")
         return agents
     
+    def get_agent_content(self, agent_name: str) -> Optional[str]:
+        """Return an agent's prompt file content, re-reading it only when it changes"""
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            return None
+        
+        mtime_ns = os.stat(agent['file']).st_mtime_ns
+        cached = self._content_cache.get(agent_name)
+        if cached is None or cached[0] != mtime_ns:
+            with open(agent['file'], 'r', encoding='utf-8') as f:
+                cached = (mtime_ns, f.read())
+            self._content_cache[agent_name] = cached
+        return cached[1]
+    
     def process_with_agent(self, agent_name: str, scene: Scene, shot: Shot) -> Dict:
         """Process shot with specific agent"""
         if agent_name not in self.agents:
@@ -256,179 +521,72 @@ class AgentOrchestrator:
     
     def _generate_agent_output(self, agent_name: str, scene: Scene, shot: Shot) -> Dict:
         """Generate agent-specific output"""
-        
-        if agent_name == "script-breakdown":
-            return {
-                "analysis": {
-                    "genre": "Drama",
-                    "tone": "Intimate",
-                    "pacing": "Measured",
-                    "emotional_arc": "Discovery to tension"
-                },
-                "shot_breakdown": {
-                    "shot_id": shot.shot_id,
-                    "necessity": "essential",
-                    "dramatic_purpose": "Establish character state and environment"
-                }
-            }
-        
-        elif agent_name == "camera-director":
-            return {
-                "shot_id": shot.shot_id,
-                "camera": {
-                    "shot_size": shot.shot_type,
-                    "angle": "Eye level" if "ESTABLISHING" in shot.shot_type else "Slight low angle",
-                    "movement": "Slow push in" if "ESTABLISHING" in shot.shot_type else "Static or subtle drift",
-                    "lens": "24mm" if "WIDE" in shot.shot_type else "50mm"
-                },
-                "visual_purpose": {
-                    "literal": "Show character and environment",
-                    "poetic": "Isolation within crowd",
-                    "emotional": "Anticipation and searching"
-                }
-            }
-        
-        elif agent_name == "lighting-designer":
-            return {
-                "shot_id": shot.shot_id,
-                "lighting_design": {
-                    "emotional_goal": "Natural realism with subtle mood",
-                    "key_light": "Window light - soft, directional",
-                    "fill_ratio": "2:1 for gentle contrast",
-                    "practicals": ["Overhead fixtures", "Window light"],
-                    "color": "5600K daylight mixed with 3200K practicals"
-                }
-            }
-        
-        elif agent_name == "sound-designer":
-            return {
-                "shot_id": shot.shot_id,
-                "soundscape": {
-                    "on_screen": ["Footsteps", "Breathing", "Clothing rustle"],
-                    "off_screen": ["Traffic", "Distant conversations"],
-                    "ambience": ["Room tone", "HVAC hum"],
-                    "spot_effects": ["Door close", "Chair scrape"]
-                },
-                "perspective": "Objective transitioning to subjective"
-            }
-        
-        elif agent_name == "music-director":
-            return {
-                "shot_id": shot.shot_id,
-                "music_decision": {
-                    "presence": "silence",
-                    "reasoning": "Let environment and tension speak"
-                },
-                "if_silence": {
-                    "type": "complete",
-                    "duration": "entire shot",
-                    "break": "none"
-                }
-            }
-        
-        elif agent_name == "character-analysis":
-            return {
-                "shot_id": shot.shot_id,
-                "characters": self._extract_characters(shot),
-                "emotional_state": "Searching, tired, anticipatory",
-                "physical_markers": "Shoulders tense, scanning motion"
-            }
-        
-        elif agent_name == "background-designer":
-            return {
-                "shot_id": shot.shot_id,
-                "environment": {
-                    "location": scene.location,
-                    "atmosphere": "Lived-in, authentic",
-                    "time_markers": scene.time_of_day,
-                    "weather": "Clear" if scene.time_of_day == "DAY" else "Overcast"
-                },
-                "design_layers": {
-                    "foreground": ["Tables", "Characters"],
-                    "midground": ["Other patrons", "Counter"],
-                    "background": ["Windows", "Street view"],
-                    "movement": ["Steam", "People passing"]
-                }
-            }
-        
-        else:  # prompt-combiner
-            return {
-                "shot_id": shot.shot_id,
-                "veo3_prompt": self._generate_veo3_prompt(scene, shot),
-                "necessity_verdict": "essential",
-                "technical_summary": {
-                    "camera": shot.shot_type,
-                    "lighting": "Natural/motivated",
-                    "audio": "Diegetic focus"
-                }
-            }
-    
-    def _extract_characters(self, shot: Shot) -> List[str]:
-        """Extract character names from shot"""
-        characters = []
-        for dialogue in shot.dialogue:
-            # Extract character name (remove parentheticals)
-            char_name = dialogue.split('(')[0].strip()
-            if char_name and char_name not in characters:
-                characters.append(char_name)
-        return characters if characters else ["SUBJECT"]
-    
-    def _generate_veo3_prompt(self, scene: Scene, shot: Shot) -> str:
-        """Generate comprehensive Veo3 prompt"""
-        prompt_parts = []
-        
-        # Camera
-        camera_desc = {
-            "WIDE ESTABLISHING": "Wide establishing shot, slow push-in, subtle handheld movement for organic feel",
-            "MEDIUM": "Medium shot, minimal movement, slight drift for life",
-            "CLOSE-UP": "Close-up, locked off or minimal float, intimate framing"
-        }.get(shot.shot_type, "Medium shot with motivated movement")
-        prompt_parts.append(f"[CAMERA] {camera_desc}")
-        
-        # Subject
-        if shot.dialogue:
-            subject = f"Characters: {', '.join(shot.dialogue[:2])}, in conversation"
-        elif shot.action:
-            subject = shot.action[:100]
-        else:
-            subject = "Environmental shot"
-        prompt_parts.append(f"[SUBJECT] {subject}")
-        
-        # Environment
-        env = f"{scene.location}, {scene.time_of_day} lighting"
-        prompt_parts.append(f"[ENVIRONMENT] {env}, lived-in details, atmospheric depth")
-        
-        # Lighting
-        lighting = "Natural daylight" if "DAY" in scene.time_of_day else "Practical sources, moody"
-        prompt_parts.append(f"[LIGHTING] {lighting}, motivated sources, cinematic contrast")
-        
-        # Music
-        prompt_parts.append("[MUSIC] No score, environmental sound only")
-        
-        # Sound
-        prompt_parts.append("[SOUND] Layered ambience, specific spot effects, off-screen world")
-        
-        return "... ".join(prompt_parts) + "..."
+        # Agents without a dedicated handler get the prompt-combiner output
+        return _AGENT_DISPATCH.get(agent_name, _prompt_combiner_output)(scene, shot)
+
+
+# Department output directories and what each one holds
+_DEPARTMENTS = {
+    "01_veo3_prompts": "Video generation prompts",
+    "02_music_cues": "Music timing and direction",
+    "03_sound_design": "Sound layers and ambience",
+    "04_continuity": "Continuity tracking",
+    "05_lighting": "Lighting setups",
+    "06_camera": "Camera coverage",
+    "07_characters": "Character details",
+    "08_environments": "Location details"
+}
 
 
 class FilmCrewProcessor:
     """Main processing engine for Film Crew AI"""
     
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, max_workers: Optional[int] = None):
         self.project_dir = project_dir
+        self.max_workers = max_workers
         self.agents_dir = project_dir / "templates" / "agents"
         self.output_dir = project_dir / "output"
         self.scripts_dir = project_dir / "scripts"
         
         self.parser = ScriptParser()
         self.orchestrator = AgentOrchestrator(self.agents_dir)
+        # With every pipeline agent loaded, shots can skip per-agent lookups
+        self._all_agents_loaded = all(name in self.orchestrator.agents for name in _AGENT_DISPATCH)
+        
+        # Directories already created by this processor
+        self._created_dirs = set()
+        self._dirs_lock = threading.Lock()
         
         # Create directories if they don't exist
-        self.output_dir.mkdir(exist_ok=True)
-        self.scripts_dir.mkdir(exist_ok=True)
+        self._ensure_dir(self.output_dir)
+        self._ensure_dir(self.scripts_dir)
+    
+    def _ensure_dir(self, path: Path, refresh: bool = False):
+        """Create a directory (and parents) unless this processor already did
+        
+        The cache assumes folders are not deleted while the processor runs.
+        If one is, _write_json fails with FileNotFoundError and calls this
+        again with refresh=True, which creates the folder anew.
+        """
+        key = str(path)
+        with self._dirs_lock:
+            if refresh or key not in self._created_dirs:
+                path.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(key)
     
-    def process_script(self, script_path: Path) -> Path:
-        """Process a single script file"""
+    def process_script(self, script_path: Path, timestamp: Optional[str] = None,
+                       parallel_scenes: bool = True) -> Path:
+        """Process a single script file
+        
+        timestamp names the output folder (YYYYmmdd_HHMM); batch runs pass one
+        shared value, otherwise the current time is used. Batch runs also pass
+        parallel_scenes=False so max_workers bounds the total thread count.
+        
+        With parallel_scenes, scenes run concurrently, so "Processing shot" log
+        lines from different scenes may interleave. If a scene fails, scenes
+        that have not started are cancelled and the error is raised once the
+        running ones finish; files those scenes already wrote are left in place.
+        """
         logger.info(f"Processing script: {script_path.name}")
         
         # Parse script
@@ -436,31 +594,20 @@ class FilmCrewProcessor:
         logger.info(f"Parsed {len(scenes)} scenes")
         
         # Create output directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         output_name = f"{script_path.stem}_{timestamp}"
         script_output_dir = self.output_dir / output_name
         
         # Create department subdirectories
-        departments = [
-            "01_veo3_prompts",
-            "02_music_cues", 
-            "03_sound_design",
-            "04_continuity",
-            "05_lighting",
-            "06_camera",
-            "07_characters",
-            "08_environments"
-        ]
-        
-        for dept in departments:
-            (script_output_dir / dept).mkdir(parents=True, exist_ok=True)
-        
-        # Process each scene and shot
-        all_outputs = []
-        for scene in scenes:
-            for shot in scene.shots:
-                shot_outputs = self._process_shot(scene, shot, script_output_dir, script_path.stem)
-                all_outputs.append(shot_outputs)
+        for dept in _DEPARTMENTS:
+            self._ensure_dir(script_output_dir / dept)
+        
+        if not parallel_scenes:
+            all_outputs = [outputs for scene in scenes
+                           for outputs in self._process_scene(scene, script_output_dir, script_path.stem)]
+        else:
+            all_outputs = self._process_scenes_parallel(scenes, script_output_dir, script_path.stem)
         
         # Create master index
         self._create_index(script_output_dir, script_path.name, scenes, all_outputs)
@@ -468,19 +615,47 @@ class FilmCrewProcessor:
         logger.info(f"Processing complete. Output: {script_output_dir}")
         return script_output_dir
     
+    def _process_scenes_parallel(self, scenes: List[Scene], output_dir: Path, script_name: str) -> List[Dict]:
+        """Process scenes concurrently; results are collected in script order"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._process_scene, scene, output_dir, script_name)
+                       for scene in scenes]
+            try:
+                return [outputs for future in futures for outputs in future.result()]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def _process_scene(self, scene: Scene, output_dir: Path, script_name: str) -> List[Dict]:
+        """Process a scene's shots in order.
+        
+        Shots of one scene share the per-scene sound and music files, so they
+        are never processed concurrently with each other.
+        """
+        return [self._process_shot(scene, shot, output_dir, script_name) for shot in scene.shots]
+    
     def _process_shot(self, scene: Scene, shot: Shot, output_dir: Path, script_name: str) -> Dict:
         """Process individual shot through all agents"""
         logger.info(f"Processing shot {shot.shot_id}")
         
-        outputs = {}
-        
-        # Process through each agent
-        for agent_name in ["script-breakdown", "camera-director", "lighting-designer",
-                          "sound-designer", "music-director", "character-analysis",
-                          "background-designer", "prompt-combiner"]:
-            
-            agent_output = self.orchestrator.process_with_agent(agent_name, scene, shot)
-            outputs[agent_name] = agent_output
+        if self._all_agents_loaded:
+            # Unrolled _AGENT_DISPATCH; tests/test_processor.py checks the two agree
+            outputs = {
+                "script-breakdown": _script_breakdown_output(scene, shot),
+                "camera-director": _camera_director_output(scene, shot),
+                "lighting-designer": _lighting_designer_output(scene, shot),
+                "sound-designer": _sound_designer_output(scene, shot),
+                "music-director": _music_director_output(scene, shot),
+                "character-analysis": _character_analysis_output(scene, shot),
+                "background-designer": _background_designer_output(scene, shot),
+                "prompt-combiner": _prompt_combiner_output(scene, shot)
+            }
+        else:
+            # Go through the orchestrator so missing agents are reported
+            outputs = {}
+            for agent_name in _AGENT_DISPATCH:
+                outputs[agent_name] = self.orchestrator.process_with_agent(agent_name, scene, shot)
         
         # Save outputs to appropriate directories
         self._save_shot_outputs(shot, outputs, output_dir, script_name)
@@ -489,42 +664,62 @@ class FilmCrewProcessor:
     
     def _save_shot_outputs(self, shot: Shot, outputs: Dict, output_dir: Path, script_name: str):
         """Save shot outputs to files with script name included"""
+        shot_stem = f"{script_name}_shot_{shot.shot_id.replace('-', '_')}"
+        scene_stem = f"{script_name}_scene_{shot.scene_number}"
         
         # Veo3 prompt
         if "prompt-combiner" in outputs:
-            prompt_file = output_dir / "01_veo3_prompts" / f"{script_name}_shot_{shot.shot_id.replace('-', '_')}.json"
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "script": script_name,
-                    "shot_id": shot.shot_id,
-                    "shot_type": shot.shot_type,
-                    "duration": shot.duration,
-                    **outputs["prompt-combiner"]
-                }, f, indent=2)
+            self._write_json(output_dir / "01_veo3_prompts" / f"{shot_stem}.json", {
+                "script": script_name,
+                "shot_id": shot.shot_id,
+                "shot_type": shot.shot_type,
+                "duration": shot.duration,
+                **outputs["prompt-combiner"]
+            })
         
         # Camera setup
         if "camera-director" in outputs:
-            camera_file = output_dir / "06_camera" / f"{script_name}_shot_{shot.shot_id.replace('-', '_')}_camera.json"
-            with open(camera_file, 'w', encoding='utf-8') as f:
-                json.dump({"script": script_name, **outputs["camera-director"]}, f, indent=2)
+            self._write_json(output_dir / "06_camera" / f"{shot_stem}_camera.json",
+                             {"script": script_name, **outputs["camera-director"]})
         
         # Lighting
         if "lighting-designer" in outputs:
-            lighting_file = output_dir / "05_lighting" / f"{script_name}_shot_{shot.shot_id.replace('-', '_')}_lighting.json"
-            with open(lighting_file, 'w', encoding='utf-8') as f:
-                json.dump({"script": script_name, **outputs["lighting-designer"]}, f, indent=2)
+            self._write_json(output_dir / "05_lighting" / f"{shot_stem}_lighting.json",
+                             {"script": script_name, **outputs["lighting-designer"]})
         
         # Sound design
         if "sound-designer" in outputs:
-            sound_file = output_dir / "03_sound_design" / f"{script_name}_scene_{shot.scene_number}_sound.json"
-            with open(sound_file, 'w', encoding='utf-8') as f:
-                json.dump({"script": script_name, **outputs["sound-designer"]}, f, indent=2)
+            self._write_json(output_dir / "03_sound_design" / f"{scene_stem}_sound.json",
+                             {"script": script_name, **outputs["sound-designer"]})
         
         # Music
         if "music-director" in outputs:
-            music_file = output_dir / "02_music_cues" / f"{script_name}_scene_{shot.scene_number}_music.json"
-            with open(music_file, 'w', encoding='utf-8') as f:
-                json.dump({"script": script_name, **outputs["music-director"]}, f, indent=2)
+            self._write_json(output_dir / "02_music_cues" / f"{scene_stem}_music.json",
+                             {"script": script_name, **outputs["music-director"]})
+    
+    def _write_json(self, path: Path, data: Dict, stream: bool = False):
+        """Write data as indented JSON, recreating its folder if it was removed"""
+        try:
+            self._dump_json(path, data, stream)
+        except FileNotFoundError:
+            self._ensure_dir(path.parent, refresh=True)
+            self._dump_json(path, data, stream)
+    
+    @staticmethod
+    def _dump_json(path: Path, data: Dict, stream: bool):
+        """Serialize data to path
+        
+        Small files are serialized in one pass (with orjson when installed).
+        With stream=True the text is written in chunks as it is encoded, so a
+        large document is never held in memory as a whole.
+        """
+        if stream:
+            with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                json.dump(data, f, indent=2)
+        elif orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            path.write_text(json.dumps(data, indent=2), encoding='utf-8')
     
     def _create_index(self, output_dir: Path, script_name: str, 
                      scenes: List[Scene], all_outputs: List[Dict]):
@@ -537,28 +732,17 @@ class FilmCrewProcessor:
             "structure": {
                 "total_scenes": len(scenes),
                 "total_shots": sum(len(scene.shots) for scene in scenes),
-                "departments": 8
+                "departments": len(_DEPARTMENTS)
             },
             "scenes": [scene.to_dict() for scene in scenes],
-            "output_directories": {
-                "01_veo3_prompts": "Video generation prompts",
-                "02_music_cues": "Music timing and direction",
-                "03_sound_design": "Sound layers and ambience",
-                "04_continuity": "Continuity tracking",
-                "05_lighting": "Lighting setups",
-                "06_camera": "Camera coverage",
-                "07_characters": "Character details",
-                "08_environments": "Location details"
-            }
+            "output_directories": _DEPARTMENTS
         }
         
-        index_file = output_dir / "INDEX.json"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2)
+        self._write_json(output_dir / "INDEX.json", index, stream=True)
     
     def process_all_scripts(self):
         """Process all scripts in the scripts directory"""
-        script_files = list(self.scripts_dir.glob("*.txt"))
+        script_files = _scan_files(self.scripts_dir, ".txt")
         
         if not script_files:
             logger.warning("No script files found in scripts directory")
@@ -566,16 +750,29 @@ class FilmCrewProcessor:
         
         logger.info(f"Found {len(script_files)} scripts to process")
         
-        for script_file in script_files:
-            try:
-                self.process_script(script_file)
-            except Exception as e:
-                logger.error(f"Error processing {script_file}: {e}")
-                continue
+        # One timestamp for the whole batch
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        
+        # Scripts are independent, so their parsing and file I/O can overlap.
+        # Each script runs its scenes serially, so this pool is the only one.
+        workers = min(self.max_workers or 8, len(script_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda script_file: self._process_script_logged(script_file, timestamp),
+                              script_files))
+    
+    def _process_script_logged(self, script_file: Path, timestamp: str):
+        """Process one script from a batch, logging failures instead of raising"""
+        try:
+            self.process_script(script_file, timestamp=timestamp, parallel_scenes=False)
+        except Exception as e:
+            logger.error(f"Error processing {script_file}: {e}")
 
 
 def main():
     """Main entry point"""
+    # Imported here so library users of this module don't pay for argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Film Crew AI - Script Processing System")
     parser.add_argument('--script', type=str, help='Path to specific script to process')
     parser.add_argument('--all', action='store_true', help='Process all scripts in scripts folder')
@@ -583,8 +780,10 @@ def main():
     
     args = parser.parse_args()
     
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     
     # Get project directory
     project_dir = Path(__file__).parent
@@ -0,0 +1,58 @@
+"""Tests for the rule-based agent outputs"""
+
+import copy
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from film_crew_ai import _AGENT_DISPATCH, Scene, Shot, ShotType  # noqa: E402
+
+
+def make_scene() -> Scene:
+    heading = "INT. KITCHEN - DAY"
+    shots = [
+        Shot(shot_id="1-1", scene_number=1, shot_number=1, scene_heading=heading,
+             action="Sarah stands at the sink.", dialogue=[],
+             shot_type=ShotType.WIDE_ESTABLISHING, duration="5-8 seconds"),
+        Shot(shot_id="1-2", scene_number=1, shot_number=2, scene_heading=heading,
+             action="", dialogue=["SARAH"],
+             shot_type=ShotType.WIDE_ESTABLISHING, duration="3-5 seconds"),
+    ]
+    return Scene(scene_number=1, heading=heading, location="KITCHEN", time_of_day="DAY",
+                 action_blocks=["Sarah stands at the sink."], dialogue_blocks=[], shots=shots)
+
+
+def scribble(value):
+    """Mutate every dict and list inside value in place"""
+    if isinstance(value, dict):
+        for key in list(value):
+            scribble(value[key])
+            value[key] = "changed"
+        value["extra"] = "changed"
+    elif isinstance(value, list):
+        for item in value:
+            scribble(item)
+        value.append("changed")
+
+
+class AgentOutputTest(unittest.TestCase):
+
+    def test_mutating_output_does_not_affect_next_shot(self):
+        scene = make_scene()
+        first, second = scene.shots
+
+        for name, handler in _AGENT_DISPATCH.items():
+            with self.subTest(agent=name):
+                expected = copy.deepcopy(handler(scene, second))
+
+                output = handler(scene, first)
+                for value in output.values():
+                    scribble(value)
+
+                self.assertEqual(handler(scene, second), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
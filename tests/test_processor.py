@@ -0,0 +1,91 @@
+"""Tests for FilmCrewProcessor file output"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from film_crew_ai import _AGENT_DISPATCH, _DEPARTMENTS, FilmCrewProcessor, ScriptParser  # noqa: E402
+
+SCRIPT = """INT. KITCHEN - NIGHT
+
+Sarah stands at the sink.
+
+She turns off the tap.
+
+SARAH
+Who's there?
+
+TOM
+Me.
+
+SARAH (O.S.)
+Oh.
+"""
+
+
+class WriteJsonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        with self.assertLogs('FilmCrewAI'):
+            self.processor = FilmCrewProcessor(Path(self.tmp.name))
+
+    def test_folder_removed_after_creation_is_recreated(self):
+        folder = self.processor.output_dir / "run" / "06_camera"
+        self.processor._ensure_dir(folder)
+        shutil.rmtree(self.processor.output_dir / "run")
+
+        for stream in (False, True):
+            with self.subTest(stream=stream):
+                path = folder / f"shot_{stream}.json"
+                self.processor._write_json(path, {"shot_id": "1-1"}, stream=stream)
+
+                self.assertEqual(json.loads(path.read_text(encoding='utf-8')), {"shot_id": "1-1"})
+                shutil.rmtree(self.processor.output_dir / "run")
+
+
+class ProcessShotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        project_dir = Path(self.tmp.name)
+        agents_dir = project_dir / "templates" / "agents"
+        agents_dir.mkdir(parents=True)
+        for name in _AGENT_DISPATCH:
+            (agents_dir / f"{name}.md").write_text(f"# {name}\n", encoding='utf-8')
+        with self.assertLogs('FilmCrewAI'):
+            self.processor = FilmCrewProcessor(project_dir)
+        self.run_dir = self.processor.output_dir / "run"
+        for dept in _DEPARTMENTS:
+            self.processor._ensure_dir(self.run_dir / dept)
+
+    def test_fast_path_matches_orchestrator(self):
+        self.assertTrue(self.processor._all_agents_loaded)
+        script_path = Path(self.tmp.name) / "script.txt"
+        script_path.write_text(SCRIPT, encoding='utf-8')
+        with self.assertLogs('FilmCrewAI'):
+            scene, = ScriptParser().parse(script_path)
+        self.assertEqual(len(scene.shots), 3)
+
+        for shot in scene.shots:
+            with self.subTest(shot=shot.shot_id), self.assertLogs('FilmCrewAI'):
+                fast = self.processor._process_shot(scene, shot, self.run_dir, "test")
+                self.processor._all_agents_loaded = False
+                try:
+                    slow = self.processor._process_shot(scene, shot, self.run_dir, "test")
+                finally:
+                    self.processor._all_agents_loaded = True
+
+                self.assertEqual(list(fast), list(slow))
+                self.assertEqual(fast, slow)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Tests for ScriptParser on small inline scripts"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from film_crew_ai import ScriptParser, ShotType  # noqa: E402
+
+TWO_SCENES = """FADE IN:
+
+INT. KITCHEN - NIGHT
+
+Sarah stands at the sink.
+
+She turns off the tap.
+
+SARAH
+(quietly)
+Who's there?
+
+EXT. STREET - DAY
+
+Cars pass by.
+"""
+
+
+class ScriptParserTest(unittest.TestCase):
+    """Parse small scripts written to a temporary file"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.parser = ScriptParser()
+
+    def parse_bytes(self, data: bytes):
+        path = Path(self.tmp.name) / "script.txt"
+        path.write_bytes(data)
+        return self.parser.parse(path)
+
+    def parse_text(self, text: str):
+        return self.parse_bytes(text.encode('utf-8'))
+
+    def test_scenes_and_shots(self):
+        scenes = self.parse_text(TWO_SCENES)
+
+        self.assertEqual([s.heading for s in scenes],
+                         ["INT. KITCHEN - NIGHT", "EXT. STREET - DAY"])
+        kitchen = scenes[0]
+        self.assertEqual((kitchen.scene_number, kitchen.location, kitchen.time_of_day),
+                         (1, "KITCHEN", "NIGHT"))
+        # Parentheticals are kept with the action, not the dialogue
+        self.assertEqual(kitchen.action_blocks,
+                         ["Sarah stands at the sink.", "She turns off the tap.", "(quietly)"])
+        self.assertEqual(kitchen.dialogue_blocks,
+                         [{'character': "SARAH", 'lines': ["Who's there?"]}])
+        self.assertEqual([shot.shot_type for shot in kitchen.shots],
+                         [ShotType.WIDE_ESTABLISHING, ShotType.MEDIUM])
+        self.assertEqual(kitchen.shots[1].dialogue, ["SARAH"])
+        self.assertEqual([shot.shot_id for shot in scenes[1].shots], ["2-1"])
+
+    def test_text_before_first_heading_is_dropped(self):
+        scenes = self.parse_text(TWO_SCENES)
+
+        for scene in scenes:
+            self.assertNotIn("FADE IN:", ' '.join(scene.action_blocks))
+
+    def test_crlf_matches_lf(self):
+        lf = self.parse_text(TWO_SCENES)
+        crlf = self.parse_bytes(TWO_SCENES.replace('\n', '\r\n').encode('utf-8'))
+
+        self.assertEqual(crlf, lf)
+
+    def test_heading_split_across_lines_is_not_detected(self):
+        scenes = self.parse_text("INT. KITCHEN -\nNIGHT\n\nSarah waits.\n")
+
+        self.assertEqual(len(scenes), 1)
+        self.assertEqual(scenes[0].heading, "INT. INTERIOR - NIGHT")
+
+    def test_no_headings_falls_back_to_single_scene(self):
+        text = "Morning light fills the room.\n\nA phone rings.\n"
+        with self.assertLogs('FilmCrewAI', level='WARNING'):
+            scenes = self.parse_text(text)
+
+        self.assertEqual(len(scenes), 1)
+        scene = scenes[0]
+        self.assertEqual(scene.heading, "INT. LOCATION - MORNING")
+        self.assertEqual(scene.action_blocks, [text])
+        self.assertEqual([shot.shot_type for shot in scene.shots],
+                         [ShotType.WIDE_ESTABLISHING])
+
+
+if __name__ == '__main__':
+    unittest.main()